@@ -1,10 +1,39 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from chatbot.core.chatbot_engine import ChatbotEngine
 from . import routes
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build heavy components once per worker instead of at import time"""
+    load_dotenv()
+    google_api_key = os.getenv("GOOGLE_API_KEY")
+    if not google_api_key:
+        raise ValueError("GOOGLE_API_KEY environment variable is required")
+
+    # Enable debug mode for development (set to False in production)
+    app.state.chatbot_engine = await asyncio.to_thread(
+        ChatbotEngine, google_api_key=google_api_key, debug=True
+    )
+    yield
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
-    app = FastAPI(title="Document Q&A API", version="1.0.0")
+    app = FastAPI(
+        title="Document Q&A API",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     
     # CORS middleware
     app.add_middleware(
@@ -18,4 +47,4 @@ def create_app() -> FastAPI:
     # Include routers
     app.include_router(routes.router, prefix="/api/v1", tags=["api"])
     
-    return app
\ No newline at end of file
+    return app
@@ -1,28 +1,47 @@
-from fastapi import APIRouter, File, UploadFile, HTTPException, Form
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Form, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from typing import List, Optional
-import os
 import json
-from dotenv import load_dotenv
+import logging
 
-from chatbot.core.document_processor import DocumentProcessor
 from chatbot.core.chatbot_engine import ChatbotEngine
 from . import schema
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-router = APIRouter()
 
-# Get Google API key from environment
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-if not GOOGLE_API_KEY:
-    raise ValueError("GOOGLE_API_KEY environment variable is required")
+class ErrorLoggingRoute(APIRoute):
+    """Route that logs unexpected errors and answers them with a generic 500.
 
-# Initialize components
-document_processor = DocumentProcessor()
-# Enable debug mode for development (set to False in production)
-chatbot_engine = ChatbotEngine(google_api_key=GOOGLE_API_KEY, debug=True)
+    Converting to HTTPException here, rather than in an app-wide Exception
+    handler, keeps the response inside CORSMiddleware so browsers can read it.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception:
+                logger.exception("Unhandled error in %s %s", request.method, request.url.path)
+                raise HTTPException(status_code=500, detail="Internal server error")
+
+        return route_handler
+
+
+router = APIRouter(route_class=ErrorLoggingRoute)
+
+
+def get_chatbot_engine(request: Request) -> ChatbotEngine:
+    """Return the engine built once by the application lifespan."""
+    return request.app.state.chatbot_engine
 
 @router.get("/", response_model=schema.HealthResponse)
 async def root():
@@ -30,83 +49,109 @@ async def root():
     return {"status": "Document Q&A API is running"}
 
 @router.post("/upload-documents", response_model=schema.UploadResponse)
-async def upload_documents(files: List[UploadFile] = File(...)):
+async def upload_documents(
+    files: List[UploadFile] = File(...),
+    chatbot_engine: ChatbotEngine = Depends(get_chatbot_engine),
+):
     """Upload and process documents for RAG"""
+    if not files:
+        raise HTTPException(status_code=400, detail="No files provided")
+    
+    uploaded_files = []
+    file_data = []
+    
+    for file in files:
+        if file.filename:
+            # Validate file type
+            if not file.filename.lower().endswith(('.pdf', '.docx', '.txt')):
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"Unsupported file type: {file.filename}"
+                )
+            
+            # Hand over the spooled upload itself; large files stay on disk
+            # instead of being copied into a bytes object first
+            file_data.append((file.filename, file.file))
+            uploaded_files.append(file.filename)
+    
+    # Process documents using ChatbotEngine (this creates vectorstore)
+    # Parsing and embedding are blocking; keep them off the event loop
+    if await run_in_threadpool(chatbot_engine.load_uploaded_files, file_data):
+        return {
+            "message": f"Successfully processed {len(uploaded_files)} documents and created vector database",
+            "files": uploaded_files
+        }
+    else:
+        raise HTTPException(status_code=500, detail="Failed to process documents")
+
+
+def _parse_history(history: Optional[str]) -> list:
+    """Decode the JSON-encoded chat history form field."""
+    if not history:
+        return []
     try:
-        if not files:
-            raise HTTPException(status_code=400, detail="No files provided")
-        
-        uploaded_files = []
-        file_data = []
-        
-        for file in files:
-            if file.filename:
-                # Validate file type
-                if not file.filename.lower().endswith(('.pdf', '.docx', '.txt')):
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Unsupported file type: {file.filename}"
-                    )
-                
-                # Read file content into memory
-                content = await file.read()
-                file_data.append((file.filename, content))
-                uploaded_files.append(file.filename)
-        
-        # Process documents using ChatbotEngine (this creates vectorstore)
-        if chatbot_engine.load_uploaded_files(file_data):
-            return {
-                "message": f"Successfully processed {len(uploaded_files)} documents and created vector database",
-                "files": uploaded_files
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to process documents")
-        
+        history_list = json.loads(history)
+        if not isinstance(history_list, list):
+            raise ValueError("History must be a list")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing documents: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Invalid history format: {str(e)}")
+    return history_list
+
 
 @router.post("/ask", response_model=schema.QuestionResponse)
 async def ask_question(
     question: str = Form(...),
-    history: Optional[str] = Form(None)
+    history: Optional[str] = Form(None),
+    chatbot_engine: ChatbotEngine = Depends(get_chatbot_engine),
 ):
     """Ask a question and get RAG-based answer, with optional chat history"""
-    try:
-        if not question.strip():
-            raise HTTPException(status_code=400, detail="Question cannot be empty")
-        
-        # Parse history if provided
-        history_list = []
-        if history:
-            try:
-                history_list = json.loads(history)
-                if not isinstance(history_list, list):
-                    raise ValueError("History must be a list")
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Invalid history format: {str(e)}")
-        
-        # Get answer from chatbot engine, passing history
-        result = chatbot_engine.chat(question, history=history_list)
-        
-        response_payload = {
-            "question": question,
-            "answer": result.get("response", ""),
-            "sources": [source["source"] for source in result.get("sources", [])]
-        }
-        # Pass through optional form fields if present
-        if "needs_info" in result:
-            response_payload["needs_info"] = result["needs_info"]
-        if "form_prompt" in result and result["form_prompt"] is not None:
-            response_payload["form_prompt"] = result["form_prompt"]
-        if "form_complete" in result:
-            response_payload["form_complete"] = result["form_complete"]
-        if "form_data" in result and result["form_data"] is not None:
-            response_payload["form_data"] = result["form_data"]
-        
-        return response_payload
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
+    if not question.strip():
+        raise HTTPException(status_code=400, detail="Question cannot be empty")
+    
+    history_list = _parse_history(history)
+    
+    # Get answer from chatbot engine, passing history. achat() runs the
+    # blocking retrieval and LLM calls off the event loop
+    result = await chatbot_engine.achat(question, history=history_list)
+    
+    response_payload = {
+        "question": question,
+        "answer": result.get("response", ""),
+        "sources": [source["source"] for source in result.get("sources", [])]
+    }
+    # Pass through optional form fields if present
+    if "needs_info" in result:
+        response_payload["needs_info"] = result["needs_info"]
+    if "form_prompt" in result and result["form_prompt"] is not None:
+        response_payload["form_prompt"] = result["form_prompt"]
+    if "form_complete" in result:
+        response_payload["form_complete"] = result["form_complete"]
+    if "form_data" in result and result["form_data"] is not None:
+        response_payload["form_data"] = result["form_data"]
+    
+    # Validate and encode in one pydantic-core pass; returning a Response
+    # skips FastAPI's second response_model validation round
+    payload = schema.QuestionResponse.model_validate(response_payload)
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
+@router.post("/ask/stream")
+async def ask_question_stream(
+    question: str = Form(...),
+    history: Optional[str] = Form(None),
+    chatbot_engine: ChatbotEngine = Depends(get_chatbot_engine),
+):
+    """Ask a question and stream the answer text as it is generated"""
+    if not question.strip():
+        raise HTTPException(status_code=400, detail="Question cannot be empty")
+    
+    history_list = _parse_history(history)
+    # Starlette iterates the synchronous generator in its threadpool
+    return StreamingResponse(
+        chatbot_engine.chat_stream(question, history=history_list),
+        media_type="text/plain; charset=utf-8",
+    )
+
 
 @router.get("/health", response_model=schema.HealthResponse)
 async def health_check():
@@ -114,7 +159,7 @@ async def health_check():
     return {"status": "healthy"}
 
 @router.get("/status")
-async def get_status():
+async def get_status(chatbot_engine: ChatbotEngine = Depends(get_chatbot_engine)):
     """Get current system status"""
     has_vectorstore = chatbot_engine.qa_chain is not None
     return {
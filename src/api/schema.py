@@ -1,14 +1,24 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
+# Models are immutable and reject unknown keys, so a typo in a route payload
+# fails loudly instead of being silently dropped
+_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
 class UploadResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     message: str
     files: List[str]
 
 class QuestionRequest(BaseModel):
+    model_config = _MODEL_CONFIG
+
     question: str = Field(..., min_length=1, description="The question to ask")
 
 class QuestionResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     question: str
     answer: str
     sources: List[str] = Field(default=[], description="Source documents")
@@ -18,13 +28,19 @@ class QuestionResponse(BaseModel):
     form_data: Optional[dict] = Field(default=None, description="Collected form data if complete")
 
 class HealthResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     status: str
 
 class StatusResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     has_documents: bool
     vectorstore_loaded: bool
     documents_directory: str
     chroma_db_directory: str
 
 class ErrorResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     detail: str
\ No newline at end of file
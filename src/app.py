@@ -4,11 +4,20 @@ import os
 from typing import List
 import tempfile
 from streamlit_calendar import calendar
-import json
+import orjson
 
 # FastAPI backend URL
 BACKEND_URL = "http://localhost:8000/api/v1"
 
+# Number of recent chat messages sent to the backend as history
+HISTORY_MAX_MESSAGES = 12
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared session so reruns reuse pooled keep-alive connections to the backend."""
+    return requests.Session()
+
 def main():
     st.set_page_config(
         page_title="Document Q&A + Appointment Form",
@@ -50,7 +59,7 @@ def document_qa_page():
                     files_data.append(('files', (file.name, file.getvalue(), file.type)))
                 
                 # Upload to FastAPI backend
-                response = requests.post(
+                response = get_http_session().post(
                     f"{BACKEND_URL}/upload-documents",
                     files=files_data
                 )
@@ -84,21 +93,22 @@ def document_qa_page():
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Prepare history for backend (only user/assistant messages)
+        # Prepare history for backend (only the most recent messages, so the
+        # payload stays bounded in long chats)
         history_list = [
             {"role": m["role"], "content": m["content"]}
-            for m in st.session_state.messages
+            for m in st.session_state.messages[-HISTORY_MAX_MESSAGES:]
         ]
         
         # Get response from FastAPI backend
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
                 try:
-                    response = requests.post(
+                    response = get_http_session().post(
                         f"{BACKEND_URL}/ask",
                         data={
                             "question": prompt,
-                            "history": json.dumps(history_list)
+                            "history": orjson.dumps(history_list)
                         }
                     )
                     
@@ -128,6 +138,60 @@ def document_qa_page():
                     st.error(error_msg)
 
 
+# Booking fields shown in the appointment list, with their column labels
+APPOINTMENT_COLUMNS = {
+    "id": "Confirmation",
+    "name": "Name",
+    "phone": "Phone",
+    "email": "Email",
+    "preferred_datetime": "Preferred",
+    "notes": "Notes",
+    "created_utc": "Created",
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_bookings(path: str, mtime: float) -> List[dict]:
+    """Parse the bookings JSONL file.
+
+    ``mtime`` is only part of the cache key: reruns reuse the parsed list
+    until a new booking is appended.
+    """
+    records = []
+    # Decode line by line from the buffered file so the raw text is never
+    # held in memory alongside the parsed records
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue
+    return records
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def build_events(path: str, mtime: float) -> List[dict]:
+    """Convert bookings into calendar events, cached on the same key as load_bookings."""
+    events = []
+    for rec in load_bookings(path, mtime):
+        dt = rec.get("preferred_datetime")
+        if not dt:
+            continue
+        events.append({
+            "title": f"{rec.get('name', 'Unknown')}",
+            "start": dt,  # must be ISO 8601 format
+            "end": dt,    # single point event
+            "extendedProps": {
+                "phone": rec.get("phone", ""),
+                "notes": rec.get("notes", ""),
+                "id": rec.get("id", "")
+            }
+        })
+    return events
+
+
 def appointment_page():
     st.subheader("Your Appointments")
 
@@ -137,31 +201,16 @@ def appointment_page():
         os.path.join(os.getcwd(), "src", "appointments", "bookings.jsonl"),
     ]
 
-    bookings_path = None
-    for p in candidates:
-        if os.path.exists(p):
-            bookings_path = p
-            break
+    bookings_path = next((p for p in candidates if os.path.isfile(p)), None)
 
     if not bookings_path:
         st.info("No bookings found yet.")
         st.caption("Bookings will appear here after you complete the chat-based appointment form.")
         return
 
-    # Load JSONL
-    records = []
+    # Load JSONL (cached until the file changes)
     try:
-        with open(bookings_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    import json
-                    rec = json.loads(line)
-                    records.append(rec)
-                except Exception:
-                    continue
+        records = load_bookings(bookings_path, os.path.getmtime(bookings_path))
     except Exception as e:
         st.error(f"Failed to read bookings: {e}")
         return
@@ -170,22 +219,8 @@ def appointment_page():
         st.info("No bookings found in the file yet.")
         return
 
-    # Convert records → calendar events
-    events = []
-    for rec in records:
-        dt = rec.get("preferred_datetime")
-        if not dt:
-            continue
-        events.append({
-            "title": f"{rec.get('name', 'Unknown')}",
-            "start": dt,  # must be ISO 8601 format
-            "end": dt,    # single point event
-            "extendedProps": {
-                "phone": rec.get("phone", ""),
-                "notes": rec.get("notes", ""),
-                "id": rec.get("id", "")
-            }
-        })
+    # Convert records → calendar events (cached alongside the records)
+    events = build_events(bookings_path, os.path.getmtime(bookings_path))
 
     # Show interactive calendar
     st.subheader("📆 Calendar View")
@@ -205,19 +240,15 @@ def appointment_page():
         key="calendar",
     )
 
-    # Show detailed list below
+    # Show detailed list below as a single table element
     st.subheader("📋 Appointment List")
-    for rec in records:
-        with st.container(border=True):
-            st.write(f"**Confirmation**: {rec.get('id', 'N/A')}")
-            st.write(f"**Name**: {rec.get('name', '')}")
-            st.write(f"**Phone**: {rec.get('phone', '')}")
-            st.write(f"**Email**: {rec.get('email', '')}")
-            st.write(f"**Preferred**: {rec.get('preferred_datetime', '')}")
-            notes = rec.get('notes')
-            if notes:
-                st.write(f"**Notes**: {notes}")
-            st.caption(f"Created: {rec.get('created_utc', '')}")
+    st.dataframe(
+        records,
+        use_container_width=True,
+        hide_index=True,
+        column_order=list(APPOINTMENT_COLUMNS),
+        column_config=APPOINTMENT_COLUMNS,
+    )
 
             
 if __name__ == "__main__":
@@ -1,8 +1,71 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Optional
-from dateutil import parser
-from datetime import datetime
+from datetime import date, datetime, time
+
+
+# ISO dates/datetimes (what the agent usually passes back) go straight to
+# fromisoformat. Matched against normalized, lowercased text.
+_ISO_RE = re.compile(r"(\d{4}-\d{2}-\d{2})(?:[t ](\d{2}:\d{2}(?::\d{2}(?:\.\d{3}(?:\d{3})?)?)?))?")
+
+# Other unambiguous, fully specified layouts tried with strptime before falling
+# back to dateutil's fuzzy parser. Month-first order matches dateutil's own
+# default so both paths agree on inputs like 01/02/2025.
+_FIXED_FORMATS = (
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%B %d %Y",
+    "%B %d, %Y",
+    "%b %d %Y",
+    "%b %d, %Y",
+)
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so equivalent phrasings share a cache key."""
+    return " ".join(text.lower().split())
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(text: str, today: date) -> Optional[datetime]:
+    """Parse normalized text, memoized per calendar day.
+
+    dateutil fills in missing fields from its ``default``; passing midnight
+    of ``today`` explicitly keeps results aligned with the cache key and
+    saves dateutil its own ``now().replace(...)`` on every miss.
+    """
+    iso = _ISO_RE.fullmatch(text)
+    if iso:
+        date_part, time_part = iso.groups()
+        try:
+            return datetime.fromisoformat(f"{date_part}T{time_part}" if time_part else date_part)
+        except ValueError:
+            pass
+    for fmt in _FIXED_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    # dateutil is only needed for free-form phrases; import it on first use
+    from dateutil import parser
+
+    try:
+        return parser.parse(text, default=datetime.combine(today, time.min), fuzzy=True)
+    except Exception:
+        return None
+
+
+def _parse(text: str) -> Optional[datetime]:
+    try:
+        key = _normalize(text)
+    except Exception:
+        return None
+    return _parse_cached(key, date.today())
 
 
 def extract_datetime(text: str) -> Optional[str]:
@@ -13,20 +76,13 @@ def extract_datetime(text: str) -> Optional[str]:
     'tomorrow 3pm', 'next monday 10', '25 Dec 2pm', etc.
     Returns an ISO-like string or None if parsing fails.
     """
-    try:
-        dt = parser.parse(text, fuzzy=True)
-        return dt.isoformat()
-    except Exception:
-        return None
+    dt = _parse(text)
+    return dt.isoformat() if dt else None
 
 
 def extract_date_ymd(text: str) -> Optional[str]:
     """Parse date-like text and return YYYY-MM-DD if possible."""
-    try:
-        dt = parser.parse(text, fuzzy=True)
-        return dt.strftime("%Y-%m-%d")
-    except Exception:
-        return None
+    dt = _parse(text)
+    return dt.strftime("%Y-%m-%d") if dt else None
 
 
- 
\ No newline at end of file
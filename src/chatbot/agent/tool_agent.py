@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, List, Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict, Any
 
 from ..form.validator import validate_name, validate_email, validate_phone
 from .date_extractor import extract_datetime, extract_date_ymd
-from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 import os
-import json
-from datetime import datetime
-from langchain.agents import AgentExecutor, create_tool_calling_agent
-from langchain.prompts import ChatPromptTemplate
+import orjson
+from datetime import datetime, timezone
+
+if TYPE_CHECKING:
+    # langchain is only imported when tools/agents are actually built
+    from langchain.tools import StructuredTool
+    from langchain.agents import AgentExecutor
 
 
 class ToolAgent:
@@ -46,45 +49,71 @@ class ToolAgent:
         notes: Optional[str] = Field(default=None, description="Optional additional notes")
 
     def tool_book_appointment(self, payload: Dict[str, Any]) -> str:
-        # Ensure directory exists
         out_dir = os.path.join(os.getcwd(), "appointments")
-        os.makedirs(out_dir, exist_ok=True)
-        # Create confirmation id
-        confirmation_id = datetime.utcnow().strftime("APPT-%Y%m%d-%H%M%S-%f")
+        # Create confirmation id; one clock read so it matches created_utc
+        now = datetime.now(timezone.utc)
+        confirmation_id = now.strftime("APPT-%Y%m%d-%H%M%S-%f")
         record = {
             "id": confirmation_id,
-            "created_utc": datetime.utcnow().isoformat(),
+            "created_utc": now.isoformat(),
             **payload,
         }
         # Append as JSONL
         out_path = os.path.join(out_dir, "bookings.jsonl")
-        with open(out_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        line = orjson.dumps(record) + b"\n"
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            fd = os.open(out_path, flags, 0o644)
+        except FileNotFoundError:
+            # Only the first booking pays for creating the directory
+            os.makedirs(out_dir, exist_ok=True)
+            fd = os.open(out_path, flags, 0o644)
+        try:
+            # One O_APPEND write per record, so concurrent writers cannot
+            # interleave partial lines
+            os.write(fd, line)
+        finally:
+            os.close(fd)
         return confirmation_id
 
     # ---- LangChain StructuredTools wrappers ----
     class _TextInput(BaseModel):
         text: str = Field(..., description="User-provided text input to validate or parse")
 
+    @staticmethod
+    def _value_if_valid(validate):
+        """Adapt a (ok, value) validator to return the value, or "" when invalid, running it once."""
+        def run(text: str) -> str:
+            ok, value = validate(text)
+            return value if ok else ""
+        return run
+
     def get_langchain_tools(self) -> List[StructuredTool]:
         """Return LangChain StructuredTool list for use with an agent executor."""
+        return self._langchain_tools
+
+    @cached_property
+    def _langchain_tools(self) -> List[StructuredTool]:
+        """Build the StructuredTool wrappers once per agent instance."""
+        from langchain.tools import StructuredTool
+
         return [
             StructuredTool.from_function(
                 name="validate_name",
                 description="Validate and normalize a person's full name.",
-                func=lambda text: self.tool_validate_name(text)[1] if self.tool_validate_name(text)[0] else "",
+                func=self._value_if_valid(self.tool_validate_name),
                 args_schema=self._TextInput,
             ),
             StructuredTool.from_function(
                 name="validate_email",
                 description="Validate and normalize an email address.",
-                func=lambda text: self.tool_validate_email(text)[1] if self.tool_validate_email(text)[0] else "",
+                func=self._value_if_valid(self.tool_validate_email),
                 args_schema=self._TextInput,
             ),
             StructuredTool.from_function(
                 name="validate_phone",
                 description="Validate and normalize a phone number into international-like format.",
-                func=lambda text: self.tool_validate_phone(text)[1] if self.tool_validate_phone(text)[0] else "",
+                func=self._value_if_valid(self.tool_validate_phone),
                 args_schema=self._TextInput,
             ),
             StructuredTool.from_function(
@@ -117,6 +146,9 @@ class ToolAgent:
         ]
 
     def build_agent(self, llm) -> AgentExecutor:
+        from langchain.agents import AgentExecutor, create_tool_calling_agent
+        from langchain.prompts import ChatPromptTemplate
+
         tools = self.get_langchain_tools()
         prompt = ChatPromptTemplate.from_messages([
             ("system", "You are an assistant that uses tools to validate inputs and book appointments."),
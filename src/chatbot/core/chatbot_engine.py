@@ -1,36 +1,129 @@
+import asyncio
+import logging
 import os
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.chains import ConversationalRetrievalChain,RetrievalQA
 from langchain.prompts import PromptTemplate
+from langchain_core.prompts import format_document
 from langchain.schema import BaseRetriever
-from .document_processor import DocumentProcessor
+from .document_processor import DocumentProcessor, chunk_preview
 from ..form.conversational_form import ConversationalForm
 from ..agent.tool_agent import ToolAgent
-from langchain.memory import ConversationBufferMemory
+
+logger = logging.getLogger(__name__)
+
+# Phrasings that mean the user wants to book an appointment or be contacted.
+# "book", "schedule" and "reserve" count as verbs unless a determiner makes
+# them nouns ("the book", "a schedule"). Phone numbers only count when they
+# are the user's or ours, not "the phone number of the clinic"
+_NOT_A_NOUN = r"(?<!\bthe\s)(?<!\ba\s)(?<!\bthis\s)(?<!\bwhat\s)(?<!\bwhich\s)"
+CONTACT_PATTERNS = (
+    r"call\s+me", r"contact\s+me", r"email\s+me", r"reach\s+out",
+    r"(?:my|your|our)\s+phone\s+number", r"appointments?",
+    _NOT_A_NOUN + r"(?:book|schedule|reserve)",
+    r"mak(?:e|ing)\s+a\s+(?:booking|reservation)",
+    r"(?:book(?:ing)?|schedul(?:e|ing)|reserv(?:e|ing)|mak(?:e|ing)|set(?:ting)?\s+up)"
+    r"\s+(?:an?\s+|the\s+)?(?:appointment|meeting|call|slot|consultation)s?",
+)
+# Whole words only, so "recall", "books", "booking" or "callback" do not count
+CONTACT_KEYWORDS_RE = re.compile(
+    r"\b(?:" + "|".join(CONTACT_PATTERNS) + r")\b",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=8)
+def _get_llm(model_name: str, google_api_key: str) -> ChatGoogleGenerativeAI:
+    """Share one Gemini client (and its connection pool) per model/key pair."""
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        google_api_key=google_api_key,
+        temperature=0.3,
+        convert_system_message_to_human=True
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_document_processor() -> DocumentProcessor:
+    """Share one DocumentProcessor so the embedding model loads once per process."""
+    return DocumentProcessor()
+
+
+def _enable_debug_logging() -> None:
+    """Print this module's debug messages, as ``debug=True`` always has."""
+    if logger.level == logging.DEBUG:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
 
 class ChatbotEngine:
     """Core chatbot engine for document-based Q&A."""
+
+    # Maximum number of distinct messages whose intent is memoized
+    INTENT_CACHE_SIZE = 512
+    # Maximum number of distinct questions whose answers are memoized
+    QA_CACHE_SIZE = 256
+    # Number of trailing history messages folded into a QA query
+    HISTORY_MAX_MESSAGES = 6
+    # Questions at least this long are treated as self-contained
+    HISTORY_MAX_QUERY_CHARS = 200
+
+    # The Q&A prompt never varies per instance, so it is built once
+    _PROMPT = PromptTemplate(
+        template="""You are a helpful AI assistant that can answer questions based on the provided documents and help users with appointment booking.
+
+            Context from documents:
+            {context}
+
+            Human: {question}
+
+            Instructions:
+            1. If the question can be answered using the provided context, give a comprehensive answer based on the documents.
+            2. If the user asks about booking appointments, scheduling, or contact information, respond that you'd be happy to help and ask for their contact details.
+            3. Be conversational, helpful, and professional.
+            4. If you cannot answer based on the context, say so politely and suggest they ask a different question.
+            5. If the question seems related to appointments or contact, mention that you can help with scheduling.
+            6. Keep responses concise but informative.
+
+            Assistant: """,
+        input_variables=["context", "question"],
+    )
     
-    def __init__(self, google_api_key: str, model_name: str = "gemini-2.0-flash", debug: bool = False):
-        self.llm = ChatGoogleGenerativeAI(
-            model=model_name,
-            google_api_key=google_api_key,
-            temperature=0.3,
-            convert_system_message_to_human=True
-        )
-        self.memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True, output_key="result")
+    def __init__(
+        self,
+        google_api_key: str,
+        model_name: str = "gemini-2.0-flash",
+        debug: bool = False,
+        use_llm_intent: bool = False,
+    ):
+        self.llm = _get_llm(model_name, google_api_key)
         self.debug = debug
+        if debug:
+            _enable_debug_logging()
+        # Ask the LLM to classify messages that contain no booking keyword
+        self.use_llm_intent = use_llm_intent
 
-        self.document_processor = DocumentProcessor()
+        self.document_processor = _get_document_processor()
         # self.qa_chain: Optional[ConversationalRetrievalChain] = None
         self.qa_chain: Optional[RetrievalQA] = None
         self.conversation_state = "general"  # general, collecting_info, booking_appointment
-        self.tools = ToolAgent()
-        self.form: ConversationalForm = ConversationalForm(tools=self.tools)
         self.in_form: bool = False
+        self._intent_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._qa_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # The API runs chat turns for the shared engine in parallel threads.
+        # _cache_lock guards the LRU caches; _state_lock guards the form
+        # flow and user info
+        self._cache_lock = threading.Lock()
+        self._state_lock = threading.Lock()
         
-        # Initialize conversation memory
         self.user_info = {
             "name": None,
             "phone": None,
@@ -39,65 +132,89 @@ class ChatbotEngine:
         
         self.setup_prompt_template()
     
-    def setup_prompt_template(self):
-        """Setup the prompt template for the Q&A chain."""
-        self.prompt_template = PromptTemplate(
-            template="""You are a helpful AI assistant that can answer questions based on the provided documents and help users with appointment booking.
+    # The booking tools and form are only needed once a user asks for an
+    # appointment, so QA-only sessions never build them
+    @cached_property
+    def tools(self) -> ToolAgent:
+        return ToolAgent()
 
-            Context from documents:
-            {context}
-
-            Human: {question}
+    @cached_property
+    def form(self) -> ConversationalForm:
+        return ConversationalForm(tools=self.tools)
 
-            Instructions:
-            1. If the question can be answered using the provided context, give a comprehensive answer based on the documents.
-            2. If the user asks about booking appointments, scheduling, or contact information, respond that you'd be happy to help and ask for their contact details.
-            3. Be conversational, helpful, and professional.
-            4. If you cannot answer based on the context, say so politely and suggest they ask a different question.
-            5. If the question seems related to appointments or contact, mention that you can help with scheduling.
-            6. Keep responses concise but informative.
-
-            Assistant: """,
-            input_variables=["context", "question"],
-        )
+    def setup_prompt_template(self):
+        """Setup the prompt template for the Q&A chain."""
+        self.prompt_template = self._PROMPT
     
     def load_uploaded_files(self, files: List[tuple]) -> bool:
         """Load and process uploaded files for the chatbot.
         
         Args:
-            files: List of tuples containing (filename, file_content_bytes)
+            files: List of tuples containing (filename, file_content_bytes_or_binary_file)
         """
         try:
             # Process documents directly from file content
             documents = self.document_processor.process_uploaded_files(files)
-            print("a")
+            logger.debug("📄 Processed %d chunks", len(documents))
             
             if not documents:
                 return False
             
-            print("b")
             # Create vector store
             vectorstore = self.document_processor.create_vectorstore(documents)
+            logger.debug("🗂️ Vector store created")
             
             # Create retrieval QA chain
-            print("c")
             self.qa_chain = RetrievalQA.from_chain_type(
                 llm=self.llm,
                 chain_type="stuff",
                 retriever=vectorstore.as_retriever(search_kwargs={"k": 4}),
                 return_source_documents=True,
                 chain_type_kwargs={"prompt": self.prompt_template},
-                memory = self.memory,
             )
-            print("d")
+            # Answers were computed against the previous documents
+            with self._cache_lock:
+                self._qa_cache.clear()
+            logger.debug("🔗 QA chain ready")
             
             return True
             
         except Exception as e:
-            print(f"Error loading documents: {str(e)}")
+            logger.error("Error loading documents: %s", e)
             return False
     
     def _detect_intent(self, message: str) -> str:
+        """Detect user intent from booking/contact keywords.
+
+        Messages without a keyword are treated as document questions unless
+        ``use_llm_intent`` is set, in which case the LLM classifies the ones
+        that are not plainly questions (memoized per normalized message).
+        """
+        if CONTACT_KEYWORDS_RE.search(message):
+            logger.debug("🔑 Keyword detected: appointment")
+            return "appointment"
+        if not self.use_llm_intent:
+            return "qa"
+        # A question with no booking keyword is about the documents
+        if message.rstrip().endswith("?"):
+            return "qa"
+
+        key = " ".join(message.lower().split())
+        intent = self._cache_get(self._intent_cache, key)
+        if intent is not None:
+            logger.debug("♻️ Cached intent: %s", intent)
+            return intent
+
+        intent = self._classify_intent(message)
+        self._cache_put(self._intent_cache, key, intent, self.INTENT_CACHE_SIZE)
+        return intent
+
+    def reset_intent_cache(self):
+        """Forget memoized intent classifications."""
+        with self._cache_lock:
+            self._intent_cache.clear()
+
+    def _classify_intent(self, message: str) -> str:
         """Use LLM to intelligently detect user intent."""
         intent_prompt = f"""
         Analyze the following user message and classify the intent into one of these categories:
@@ -111,53 +228,26 @@ class ChatbotEngine:
         Respond with only the category (qa, appointment, or contact):
         """
         
-        if self.debug:
-            print(f"🔍 Intent detection prompt: {intent_prompt}")
+        logger.debug("🔍 Intent detection prompt: %s", intent_prompt)
         
         try:
             response = self.llm.invoke(intent_prompt)
             intent = response.content.strip().lower()
             
-            if self.debug:
-                print(f"🤖 LLM intent response: '{intent}'")
+            logger.debug("🤖 LLM intent response: '%s'", intent)
             
             # Validate the response
             if intent in ["qa", "appointment", "contact"]:
-                if self.debug:
-                    print(f"✅ Intent detected: {intent}")
+                logger.debug("✅ Intent detected: %s", intent)
                 return intent
             else:
-                # Fallback to keyword-based detection if LLM response is unexpected
-                if self.debug:
-                    print(f"⚠️ Unexpected LLM response, falling back to keyword detection")
-                contact_keywords = [
-                    "call me", "contact me", "book appointment", "schedule", 
-                    "call", "reach out", "appointment", "phone number", "email me",
-                    "book", "reserve", "make appointment", "set up meeting"
-                ]
-                if any(keyword in message.lower() for keyword in contact_keywords):
-                    if self.debug:
-                        print(f"🔑 Keyword fallback detected: appointment")
-                    return "appointment"
-                if self.debug:
-                    print(f"🔑 Keyword fallback detected: qa")
+                # The keyword check already ran and found nothing, so fall back to QA
+                logger.debug("⚠️ Unexpected LLM response, falling back to qa")
                 return "qa"
                 
         except Exception as e:
-            if self.debug:
-                print(f"❌ Error in intent detection: {e}")
-            # Fallback to keyword-based detection
-            contact_keywords = [
-                "call me", "contact me", "book appointment", "schedule", 
-                "call", "reach out", "appointment", "phone number", "email me",
-                "book", "reserve", "make appointment", "set up meeting"
-            ]
-            if any(keyword in message.lower() for keyword in contact_keywords):
-                if self.debug:
-                    print(f"🔑 Error fallback detected: appointment")
-                return "appointment"
-            if self.debug:
-                print(f"🔑 Error fallback detected: qa")
+            logger.debug("❌ Error in intent detection: %s", e)
+            # The keyword check already ran and found nothing, so fall back to QA
             return "qa"
 
     def chat(self, message: str, history: Optional[list] = None) -> Dict[str, Any]:
@@ -171,17 +261,30 @@ class ChatbotEngine:
             }
 
         # Use LLM to intelligently detect intent
-        intent = self._detect_intent(message)
-        
-        if self.debug:
-            print(f"🎯 Detected intent: {intent}")
-            print(f"📝 Current form state: in_form={self.in_form}")
+        return self._respond(message, history, self._detect_intent(message))
+
+    def _respond(self, message: str, history: Optional[list], intent: str) -> Dict[str, Any]:
+        """Run the form or QA turn for a message whose intent is already known."""
+        logger.debug("🎯 Detected intent: %s", intent)
+        logger.debug("📝 Current form state: in_form=%s", self.in_form)
          
         
-        # If intent is appointment/contact and we're not in form, reset form to give fresh start
-        if intent in ["appointment", "contact"] and not self.in_form:
-            if self.debug:
-                print(f"🔄 Resetting form for new appointment request")
+        # If already in form flow or intent detected, run form conversation instead of QA
+        with self._state_lock:
+            if self.in_form or intent in ["appointment", "contact"]:
+                logger.debug("🔄 Switching to form mode (intent: %s, in_form: %s)", intent, self.in_form)
+                return self._form_turn(message)
+
+        # Normal QA flow
+        logger.debug("📚 Staying in QA mode for intent: %s", intent)
+        
+        return self._answer_question(message, history)
+
+    def _form_turn(self, message: str) -> Dict[str, Any]:
+        """Start or continue the booking form. Called with ``_state_lock`` held."""
+        # A new appointment request gets a fresh form
+        if not self.in_form:
+            logger.debug("🔄 Resetting form for new appointment request")
             self.form.reset()
             self.user_info = {
                 "name": None,
@@ -189,97 +292,124 @@ class ChatbotEngine:
                 "email": None
             }
         
-        # If already in form flow or intent detected, run form conversation instead of QA
-        if self.in_form or intent in ["appointment", "contact"]:
-            if self.debug:
-                print(f"🔄 Switching to form mode (intent: {intent}, in_form: {self.in_form})")
-            
-            form_started_now = False
-            if not self.in_form:
-                # Start the form flow
-                self.in_form = True
-                form_started_now = True
-                first_prompt = self.form.start()
-                if self.debug:
-                    print(f"🚀 Form started with prompt: {first_prompt}")
-                return {
-                    "response": "I can help schedule that. I'll need a few details.",
-                    "sources": [],
-                    "needs_info": True,
-                    "form_prompt": first_prompt,
-                    "form_complete": False,
-                }
-
-            # We are in the middle of the form
-            reply, next_prompt = self.form.handle_input(message)
-            if self.form.is_complete():
-                data = self.form.get_data()
-                # Keep a copy in user_info
-                self.user_info.update({
-                    "name": data.get("name"),
-                    "phone": data.get("phone"),
-                    "email": data.get("email"),
-                })
-                # Auto-book via tool agent
-                confirmation_id = None
-                try:
-                    confirmation_id = self.tools.tool_book_appointment(data)
-                except Exception:
-                    confirmation_id = None
-                self.in_form = False
-                return {
-                    "response": (
-                        "Thanks! I have all the details and will proceed with booking." if not confirmation_id
-                        else f"Your appointment is booked. Confirmation: {confirmation_id}"
-                    ),
-                    "sources": [],
-                    "needs_info": False,
-                    "form_complete": True,
-                    "form_data": data,
-                }
-
+        form_started_now = False
+        if not self.in_form:
+            # Start the form flow
+            self.in_form = True
+            form_started_now = True
+            first_prompt = self.form.start()
+            logger.debug("🚀 Form started with prompt: %s", first_prompt)
             return {
-                "response": reply,
+                "response": "I can help schedule that. I'll need a few details.",
                 "sources": [],
                 "needs_info": True,
-                "form_prompt": next_prompt,
+                "form_prompt": first_prompt,
                 "form_complete": False,
             }
 
-        # Normal QA flow
-        if self.debug:
-            print(f"📚 Staying in QA mode for intent: {intent}")
+        # We are in the middle of the form
+        reply, next_prompt = self.form.handle_input(message)
+        if self.form.is_complete():
+            data = self.form.get_data()
+            # Keep a copy in user_info
+            self.user_info.update({
+                "name": data.get("name"),
+                "phone": data.get("phone"),
+                "email": data.get("email"),
+            })
+            # Auto-book via tool agent
+            confirmation_id = None
+            try:
+                confirmation_id = self.tools.tool_book_appointment(data)
+            except Exception:
+                confirmation_id = None
+            self.in_form = False
+            return {
+                "response": (
+                    "Thanks! I have all the details and will proceed with booking." if not confirmation_id
+                    else f"Your appointment is booked. Confirmation: {confirmation_id}"
+                ),
+                "sources": [],
+                "needs_info": False,
+                "form_complete": True,
+                "form_data": data,
+            }
+
+        return {
+            "response": reply,
+            "sources": [],
+            "needs_info": True,
+            "form_prompt": next_prompt,
+            "form_complete": False,
+        }
+
+    async def achat(self, message: str, history: Optional[list] = None) -> Dict[str, Any]:
+        """Async variant of chat().
+
+        When the LLM intent classifier is enabled, the QA answer is computed
+        concurrently with it and only used if the intent turns out to be QA.
+        """
+        speculate = (
+            self.use_llm_intent
+            and self.qa_chain is not None
+            and not self.in_form
+            and not CONTACT_KEYWORDS_RE.search(message)
+        )
+        if not speculate:
+            return await asyncio.to_thread(self.chat, message, history)
+
+        intent, answer = await asyncio.gather(
+            asyncio.to_thread(self._detect_intent, message),
+            asyncio.to_thread(self._answer_question, message, history),
+        )
+        if intent == "qa":
+            return answer
+        return await asyncio.to_thread(self._respond, message, history, intent)
+
+    def _build_query(self, message: str, history: Optional[list] = None) -> str:
+        """Fold recent history into the retrieval query for short follow-ups."""
+        # Format history for prompt. Only short follow-ups need earlier
+        # turns, and only the most recent ones are kept so the prompt
+        # doesn't grow with the conversation
+        history_text = ""
+        if history and len(message) < self.HISTORY_MAX_QUERY_CHARS:
+            history_text = "\n".join(
+                f"{h['role'].capitalize()}: {h['content']}"
+                for h in history[-self.HISTORY_MAX_MESSAGES:]
+                if 'role' in h and 'content' in h
+            )
         
+        # For RetrievalQA, we only pass the query
+        # If you want to include chat history context, you'd need to modify the query
+        enhanced_query = message
+        if history_text:
+            enhanced_query = f"Context from previous conversation: {history_text}\n\nCurrent question: {message}"
+        return enhanced_query
+
+    def _answer_question(self, message: str, history: Optional[list] = None) -> Dict[str, Any]:
+        """Answer a question from the uploaded documents."""
         try:
-            # Format history for prompt
-            history_text = ""
-            if history:
-                history_text = "\n".join(
-                    f"{h['role'].capitalize()}: {h['content']}" for h in history if 'role' in h and 'content' in h
-                )
+            enhanced_query = self._build_query(message, history)
+            logger.debug("🔍 Enhanced query: %.100s...", enhanced_query)
             
-            # For RetrievalQA, we only pass the query
-            # If you want to include chat history context, you'd need to modify the query
-            enhanced_query = message
-            if history_text:
-                enhanced_query = f"Context from previous conversation: {history_text}\n\nCurrent question: {message}"
-            
-            if self.debug:
-                print(f"🔍 Enhanced query: {enhanced_query[:100]}...")
+            # Identical questions (with identical history) against the same
+            # documents get the same answer; skip retrieval and the LLM call
+            cache_key = self._qa_cache_key(enhanced_query)
+            cached = self._cache_get(self._qa_cache, cache_key)
+            if cached is not None:
+                logger.debug("♻️ Cached answer")
+                return {
+                    "response": cached["response"],
+                    "sources": list(cached["sources"]),
+                    "needs_info": False,
+                }
             
             result = self.qa_chain.invoke({
                 "query": enhanced_query,
             })
             response = result["result"]
-            sources = []
-            if "source_documents" in result:
-                sources = [
-                    {
-                        "source": doc.metadata.get("source", "Unknown"),
-                        "content": doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content,
-                    }
-                    for doc in result["source_documents"]
-                ]
+            sources = list(self._iter_sources(result.get("source_documents", ())))
+            self._remember_answer(cache_key, response, sources)
             return {
                 "response": response,
                 "sources": sources,
@@ -292,12 +422,100 @@ class ChatbotEngine:
                 "needs_info": False,
             }
     
+    def chat_stream(self, message: str, history: Optional[list] = None) -> Iterator[str]:
+        """Like chat(), but yield the answer text as the LLM generates it.
+
+        Form turns, cached answers and errors before the first token are
+        yielded as a single piece, exactly as chat() would answer them. An
+        error after tokens have been sent is raised instead, so the stream
+        is cut off rather than ending in an error message.
+        """
+        if not self.qa_chain and not self.in_form:
+            yield self.chat(message, history)["response"]
+            return
+        intent = self._detect_intent(message)
+        if self.in_form or intent != "qa":
+            yield self._respond(message, history, intent)["response"]
+            return
+
+        enhanced_query = self._build_query(message, history)
+        cache_key = self._qa_cache_key(enhanced_query)
+        cached = self._cache_get(self._qa_cache, cache_key)
+        if cached is not None:
+            logger.debug("♻️ Cached answer")
+            yield cached["response"]
+            return
+
+        parts = []
+        try:
+            # Same retrieval and prompt as the QA chain, but calling the LLM
+            # directly lets the tokens through as they arrive
+            docs = self.qa_chain.retriever.invoke(enhanced_query)
+            for chunk in self.llm.stream(self._stuff_prompt(enhanced_query, docs)):
+                parts.append(chunk.content)
+                yield chunk.content
+        except Exception as e:
+            if parts:
+                logger.error("Answer stream failed after %d chunks: %s", len(parts), e)
+                raise
+            yield f"I encountered an error while processing your question: {str(e)}"
+            return
+
+        self._remember_answer(cache_key, "".join(parts), list(self._iter_sources(docs)))
+
+    def _stuff_prompt(self, query: str, docs) -> str:
+        """Format the prompt the QA chain's "stuff" step would send for docs."""
+        stuff_chain = self.qa_chain.combine_documents_chain
+        context = stuff_chain.document_separator.join(
+            format_document(doc, stuff_chain.document_prompt) for doc in docs
+        )
+        return stuff_chain.llm_chain.prompt.format(
+            **{stuff_chain.document_variable_name: context, "question": query}
+        )
+
+    @staticmethod
+    def _iter_sources(docs) -> Iterator[Dict[str, Any]]:
+        """Yield the source entry returned with an answer for each retrieved chunk."""
+        for doc in docs:
+            yield {
+                "source": doc.metadata.get("source", "Unknown"),
+                # Chunks stored before previews existed have none
+                "content": doc.metadata.get("preview") or chunk_preview(doc.page_content),
+            }
+
+    @staticmethod
+    def _qa_cache_key(enhanced_query: str) -> str:
+        """Normalize case and whitespace so trivial variations share an entry."""
+        return " ".join(enhanced_query.lower().split())
+
+    def _remember_answer(self, cache_key: str, response: str, sources: List[Dict[str, Any]]):
+        """Memoize an answer, evicting the least recently used one when full."""
+        self._cache_put(
+            self._qa_cache, cache_key, {"response": response, "sources": sources}, self.QA_CACHE_SIZE
+        )
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Any:
+        """Return a cached value (or None) and mark it most recently used."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any, max_size: int):
+        """Store a value, evicting the least recently used entry past max_size."""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
     def reset_form(self):
         """Reset the form state and return to QA mode."""
-        if self.debug:
-            print(f"🔄 Resetting form state")
-        self.in_form = False
-        self.form.reset()
+        logger.debug("🔄 Resetting form state")
+        with self._state_lock:
+            self.in_form = False
+            self.form.reset()
         return {
             "response": "Form reset. I'm ready to answer questions about your documents.",
             "sources": [],
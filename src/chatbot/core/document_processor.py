@@ -1,101 +1,304 @@
+import hashlib
 import os
-from typing import List, Optional, Union
-import PyPDF2
-import docx2txt
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Tuple, Union
 from io import BytesIO
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
-from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import HuggingFaceEmbeddings
-import shutil
+from pathlib import Path
+from langchain_core.documents import Document
 import gc
 
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import Chroma
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from langchain.embeddings import CacheBackedEmbeddings
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+try:
+    # Optional: PDFium's C text extraction is much faster than PyPDF2's
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+# PDFium is not thread-safe, even across separate documents, and the API
+# can process uploads from several requests at once
+_PDFIUM_LOCK = threading.Lock()
+
+# Embedding models selectable with EMBEDDINGS_MODE. Static embeddings skip the
+# transformer and encode orders of magnitude faster on CPU, at some quality cost
+EMBEDDING_MODELS = {
+    "minilm": "sentence-transformers/all-MiniLM-L6-v2",
+    "static": "sentence-transformers/static-retrieval-mrl-en-v1",
+}
+# Length of the chunk excerpt shown alongside answers as a source
+PREVIEW_CHARS = 200
+# Chunks per embedding forward pass. sentence-transformers already sorts each
+# call's texts by length, so larger batches mostly save per-batch overhead
+EMBED_BATCH_SIZE = 64
+
+
+def chunk_preview(text: str) -> str:
+    """The first PREVIEW_CHARS characters of a chunk, with "..." if truncated."""
+    return text[:PREVIEW_CHARS] + "..." if len(text) > PREVIEW_CHARS else text
+
+
+def _embedding_model() -> str:
+    """Model name for EMBEDDINGS_MODE (default "minilm")."""
+    mode = os.getenv("EMBEDDINGS_MODE", "minilm")
+    if mode not in EMBEDDING_MODELS:
+        raise ValueError(f"Unsupported EMBEDDINGS_MODE: {mode}")
+    return EMBEDDING_MODELS[mode]
+
+
+def _embeddings_backend() -> str:
+    """EMBEDDINGS_BACKEND: "torch" (default) or "onnx" (needs optimum[onnxruntime])."""
+    backend = os.getenv("EMBEDDINGS_BACKEND", "torch")
+    if backend not in ("torch", "onnx"):
+        raise ValueError(f"Unsupported EMBEDDINGS_BACKEND: {backend}")
+    return backend
+
+
+def _embeddings_device() -> str:
+    """EMBEDDINGS_DEVICE if set, otherwise CUDA when available, else CPU."""
+    device = os.getenv("EMBEDDINGS_DEVICE")
+    if device:
+        return device
+    import torch  # already a sentence-transformers dependency
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _limit_cpu_threads() -> None:
+    """Cap torch's intra-op threads (EMBED_THREADS, default 8) for CPU encoding.
+
+    MiniLM encoding stops scaling past a handful of cores; using every
+    logical core mostly adds contention.
+    """
+    import torch
+
+    threads = int(os.getenv("EMBED_THREADS", "8"))
+    torch.set_num_threads(max(1, min(threads, os.cpu_count() or 1)))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only allowed before torch has started any parallel work
+        pass
+
+
 class DocumentProcessor:
     """Handles document loading, processing, and vector storage."""
     
-    def __init__(self, persist_directory: str = "./chroma_db"):
+    def __init__(
+        self,
+        persist_directory: str = "./chroma_db",
+        embedding_cache_directory: str = "./embedding_cache",
+    ):
         self.persist_directory = persist_directory
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2", model_kwargs={"device": "cpu"}
+        self.embedding_cache_directory = embedding_cache_directory
+        self.embedding_model = _embedding_model()
+        self.vectorstore: Optional["Chroma"] = None
+
+    # The embedding model, vector store and splitter libraries take seconds
+    # to import and load, so they are deferred until a document is processed
+    @cached_property
+    def _embedding_runtime(self) -> Tuple[str, str, str]:
+        """(device, backend, dtype) the embedding model runs with."""
+        device = _embeddings_device()
+        backend = _embeddings_backend()
+        # Half precision doubles GPU throughput; cosine rankings are unaffected
+        half = backend == "torch" and device.startswith("cuda")
+        return device, backend, "fp16" if half else "fp32"
+
+    @cached_property
+    def hf_embeddings(self) -> "HuggingFaceEmbeddings":
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+
+        device, backend, dtype = self._embedding_runtime
+        if device == "cpu":
+            _limit_cpu_threads()
+        # sentence-transformers exports and caches the ONNX graph itself
+        hf_embeddings = HuggingFaceEmbeddings(
+            model_name=self.embedding_model,
+            model_kwargs={"device": device, "backend": backend},
+            encode_kwargs={"batch_size": EMBED_BATCH_SIZE},
+        )
+        if dtype == "fp16":
+            hf_embeddings.client.half()
+        return hf_embeddings
+
+    @cached_property
+    def embeddings(self) -> "CacheBackedEmbeddings":
+        from langchain.embeddings import CacheBackedEmbeddings
+        from langchain.storage import LocalFileStore
+
+        # Chunk vectors are cached on disk by content hash, model, backend
+        # and precision, so unchanged text is never encoded twice, even for a
+        # new vector store. Vectors from another runtime are cleared out
+        self.prune_embedding_cache()
+        return CacheBackedEmbeddings.from_bytes_store(
+            self.hf_embeddings,
+            LocalFileStore(self.embedding_cache_directory),
+            namespace=self.embedding_namespace,
+            key_encoder="blake2b",
         )
-        self.text_splitter = RecursiveCharacterTextSplitter(
+
+    @property
+    def embedding_namespace(self) -> str:
+        """Cache sub-directory for the current model and runtime."""
+        _, backend, dtype = self._embedding_runtime
+        return f"{self.embedding_model}-{backend}-{dtype}/"
+
+    @cached_property
+    def text_splitter(self) -> "RecursiveCharacterTextSplitter":
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+        return RecursiveCharacterTextSplitter(
             chunk_size=1000,
             chunk_overlap=200,
             length_function=len,
         )
-        self.vectorstore: Optional[Chroma] = None
         
-    def process_file_content(self, file_content: bytes, filename: str) -> str:
-        """Process file content directly from bytes without saving to disk."""
+    @staticmethod
+    def _as_stream(file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Wrap raw bytes in a stream; rewind file objects (e.g. spooled uploads)."""
+        if isinstance(file_content, (bytes, bytearray)):
+            return BytesIO(file_content)
+        file_content.seek(0)
+        return file_content
+
+    def process_file_content(self, file_content: Union[bytes, BinaryIO], filename: str) -> str:
+        """Process file content directly from bytes or a binary file object without saving to disk."""
         _, ext = os.path.splitext(filename.lower())
         
         try:
             if ext == '.txt':
-                return file_content.decode('utf-8')
+                return self._as_stream(file_content).read().decode('utf-8')
             elif ext == '.pdf':
                 return self._extract_pdf_text_from_bytes(file_content)
             elif ext == '.docx':
-                return docx2txt.process(BytesIO(file_content))
+                import docx2txt
+
+                return docx2txt.process(self._as_stream(file_content))
             else:
                 raise ValueError(f"Unsupported file format: {ext}")
         except Exception as e:
             raise Exception(f"Error processing file {filename}: {str(e)}")
     
-    def _extract_pdf_text_from_bytes(self, pdf_content: bytes) -> str:
-        """Extract text from PDF content in bytes."""
-        text = ""
-        pdf_file = BytesIO(pdf_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+    def _extract_pdf_text_from_bytes(self, pdf_content: Union[bytes, BinaryIO]) -> str:
+        """Extract text from PDF content in bytes or a binary file object."""
+        if pdfium is not None:
+            return self._extract_pdf_text_pdfium(pdf_content)
+
+        import PyPDF2
+
+        pdf_reader = PyPDF2.PdfReader(self._as_stream(pdf_content))
+        return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
+
+    def _extract_pdf_text_pdfium(self, pdf_content: Union[bytes, BinaryIO]) -> str:
+        """Extract text from PDF content with pypdfium2."""
+        # PDFium reads from the stream on demand, so spooled uploads are not
+        # copied into memory; the caller still owns (and closes) the stream
+        pdf_stream = self._as_stream(pdf_content)
+        pages = []
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(pdf_stream, autoclose=False)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    # PDFium reports line breaks as CRLF
+                    pages.append(textpage.get_text_range().replace("\r\n", "\n"))
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        return "".join(page + "\n" for page in pages)
     
     def process_uploaded_files(self, files: List[tuple]) -> List[Document]:
         """Process multiple uploaded files and return list of Document objects.
         
         Args:
-            files: List of tuples containing (filename, file_content_bytes)
+            files: List of tuples containing (filename, file_content_bytes_or_binary_file)
         """
-        documents = []
-        
-        for filename, file_content in files:
-            try:
-                text = self.process_file_content(file_content, filename)
-                # Create chunks from the text
-                chunks = self.text_splitter.split_text(text)
-                
-                # Convert chunks to Document objects
-                for i, chunk in enumerate(chunks):
-                    doc = Document(
-                        page_content=chunk,
-                        metadata={
-                            "source": filename,
-                            "chunk_id": i
-                        }
-                    )
-                    documents.append(doc)
-                    
-            except Exception as e:
-                print(f"Error processing {filename}: {str(e)}")
-                continue
+        return [
+            doc
+            for filename, file_content in files
+            for doc in self._process_one(filename, file_content)
+        ]
+
+    def _process_one(self, filename: str, file_content: Union[bytes, BinaryIO]) -> List[Document]:
+        """Extract, chunk and wrap a single file; errors are reported and skipped."""
+        try:
+            text = self.process_file_content(file_content, filename)
+            # Create chunks from the text
+            chunks = self.text_splitter.split_text(text)
+        except Exception as e:
+            print(f"Error processing {filename}: {str(e)}")
+            return []
         
-        return documents
+        # Convert chunks to Document objects
+        return [
+            Document(
+                page_content=chunk,
+                metadata={
+                    "source": filename,
+                    "chunk_id": i,
+                    "preview": chunk_preview(chunk),
+                }
+            )
+            for i, chunk in enumerate(chunks)
+        ]
     
-    def create_vectorstore(self, documents: List[Document]) -> Chroma:
-        """Create and persist a fresh vector store from documents (deletes old DB)."""
+    @staticmethod
+    def _chunk_id(doc: Document) -> str:
+        """Hash of source and content used as the Chroma id.
+
+        Re-uploading a file maps to ids already stored, while the same text
+        in another file still gets its own entry (and keeps its source).
+        """
+        key = f"{doc.metadata.get('source', '')}\0{doc.page_content}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def create_vectorstore(self, documents: List[Document]) -> "Chroma":
+        """Add documents to the persisted vector store, embedding only unseen chunks."""
         if not documents:
             raise ValueError("No documents provided to create vectorstore")
 
-    
+        if self.vectorstore is None:
+            from langchain_community.vectorstores import Chroma
 
-        self.vectorstore = Chroma.from_documents(
-            documents=documents,
-            embedding=self.embeddings,
-            persist_directory=self.persist_directory
-        )
+            self.vectorstore = Chroma(
+                embedding_function=self.embeddings,
+                persist_directory=self.persist_directory
+            )
+
+        # Re-uploaded files (and chunks repeated within a file) hash to ids
+        # the store already holds, so they are not added again. Repeated text
+        # under another source is still stored, but its embedding comes from
+        # the embeddings cache
+        unique_docs = {}
+        for doc in documents:
+            unique_docs.setdefault(self._chunk_id(doc), doc)
+        existing = set(self.vectorstore.get(ids=list(unique_docs), include=[])["ids"])
+        new_ids = [chunk_id for chunk_id in unique_docs if chunk_id not in existing]
+        if new_ids:
+            self.vectorstore.add_documents(
+                [unique_docs[chunk_id] for chunk_id in new_ids], ids=new_ids
+            )
         return self.vectorstore
 
     
-    def get_vectorstore(self) -> Optional[Chroma]:
+    def prune_embedding_cache(self):
+        """Delete cached embeddings from other models, backends or precisions."""
+        root = Path(self.embedding_cache_directory)
+        keep = root / self.embedding_namespace
+        # Children come before their parents, so emptied directories go too
+        for path in sorted(root.rglob("*"), reverse=True):
+            if path == keep or keep in path.parents or path in keep.parents:
+                continue
+            if path.is_dir():
+                path.rmdir()
+            else:
+                path.unlink()
+
+    def get_vectorstore(self) -> Optional["Chroma"]:
         """Get the current vectorstore instance."""
         return self.vectorstore
\ No newline at end of file
@@ -7,6 +7,24 @@ from .validator import (
 )
 from ..agent.tool_agent import ToolAgent
 
+# Question asked for each field, and the acknowledgement once it is filled
+_PROMPTS: Dict[str, str] = {
+    "name": "Sure — what is your full name?",
+    "phone": "What's the best phone number to reach you?",
+    "email": "And your email address?",
+    "preferred_datetime": (
+        "When would you prefer the appointment?."
+    ),
+    "notes": "Any additional notes or preferences? (optional)",
+}
+_ACKS: Dict[str, str] = {
+    "name": "Thanks!",
+    "phone": "Got it.",
+    "email": "Thanks.",
+    "preferred_datetime": "Noted.",
+    "notes": "Thanks for the details.",
+}
+
 
 class ConversationalForm:
     """Stateful conversational form for collecting booking/contact details.
@@ -121,26 +139,10 @@ class ConversationalForm:
     def _prompt_for(self, field: Optional[str]) -> Optional[str]:
         if field is None:
             return None
-        prompts = {
-            "name": "Sure — what is your full name?",
-            "phone": "What's the best phone number to reach you?",
-            "email": "And your email address?",
-            "preferred_datetime": (
-                "When would you prefer the appointment?."
-            ),
-            "notes": "Any additional notes or preferences? (optional)",
-        }
-        return prompts.get(field, "Could you provide that information?")
+        return _PROMPTS.get(field, "Could you provide that information?")
 
     def _ack(self, field: str) -> str:
-        messages = {
-            "name": "Thanks!",
-            "phone": "Got it.",
-            "email": "Thanks.",
-            "preferred_datetime": "Noted.",
-            "notes": "Thanks for the details.",
-        }
-        return messages.get(field, "Thanks.")
+        return _ACKS.get(field, "Thanks.")
 
     def _validate_and_normalize(self, field: str, user_text: str) -> Tuple[bool, str]:
         text = user_text.strip()
@@ -1,6 +1,24 @@
 import re
 from typing import Tuple
 
+_EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+
+
+class _DigitsOnlyTable(dict):
+    """str.translate table that deletes everything except decimal digits.
+
+    Latin-1 is precomputed; rarer characters are checked on lookup, so the
+    result matches re.sub(r"\\D", "", text) for any input.
+    """
+
+    def __missing__(self, codepoint: int):
+        return codepoint if chr(codepoint).isdecimal() else None
+
+
+_DIGITS_ONLY = _DigitsOnlyTable(
+    (c, c if chr(c).isdecimal() else None) for c in range(256)
+)
+
 
 def validate_name(text: str) -> Tuple[bool, str]:
     cleaned = " ".join(part.capitalize() for part in text.split())
@@ -10,14 +28,13 @@ def validate_name(text: str) -> Tuple[bool, str]:
 
 
 def validate_email(text: str) -> Tuple[bool, str]:
-    pattern = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
-    if not re.match(pattern, text):
+    if not _EMAIL_RE.match(text):
         return False, "That doesn't look like a valid email. Could you recheck it?"
     return True, text.lower()
 
 
 def validate_phone(text: str) -> Tuple[bool, str]:
-    digits = re.sub(r"\D", "", text)
+    digits = text.translate(_DIGITS_ONLY)
     if len(digits) < 10:
         return False, "Please provide a valid phone number with at least 10 digits."
     # Basic formatting: +<country?> <area?> <rest>
@@ -19,4 +19,6 @@ if __name__ == "__main__":
     print("🚀 Starting Document Q&A API...")
     print("📚 Backend will be available at: http://localhost:8000")
     print("📖 API docs will be available at: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvicorn[standard] provides uvloop and httptools, which "auto" picks up
+    # when available; keep idle connections from the frontend open longer
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto", timeout_keep_alive=30)
\ No newline at end of file
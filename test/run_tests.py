@@ -9,7 +9,7 @@ import sys
 import os
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
 
 def run_focused_tests():
@@ -26,7 +26,8 @@ def run_focused_tests():
         'test_chat', 
         'test_date_extractor',
         'test_validator',
-        'test_routes'
+        'test_routes',
+        'test_document_processor'
     ]
     
     suite = unittest.TestSuite()
@@ -73,7 +74,8 @@ def list_focused_tests():
         'test_chat.py',
         'test_date_extractor.py',
         'test_validator.py',
-        'test_routes.py'
+        'test_routes.py',
+        'test_document_processor.py'
     ]
     
     for test_file in focused_test_files:
@@ -8,34 +8,34 @@ import os
 import sys
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+try:
+    from chatbot.agent import date_extractor
+except ImportError:
+    date_extractor = None
+
+# Words that mark a phrase as a date pattern
+_DATE_WORDS = ("tomorrow", "monday", "december", "today", "week", "morning", "afternoon")
 
 
 class TestDateExtractor(unittest.TestCase):
     """Simple tests for date extraction."""
     
+    @unittest.skipIf(date_extractor is None, "date_extractor unavailable")
     def test_date_extractor_import(self):
-        """Test that date extractor can be imported."""
-        try:
-            from chatbot.agent.date_extractor import DateExtractor
-            print("✅ DateExtractor import successful")
-            self.assertTrue(True)
-        except ImportError as e:
-            print(f"⚠️ DateExtractor import failed: {e}")
-            self.skipTest("Skipping date extractor tests due to import failure")
+        """Test that the date extraction functions can be imported."""
+        for func in (date_extractor.extract_datetime, date_extractor.extract_date_ymd):
+            self.assertTrue(callable(func))
     
-    def test_date_extractor_creation(self):
-        """Test that date extractor can be created."""
-        try:
-            from chatbot.agent.date_extractor import DateExtractor
-            
-            extractor = DateExtractor()
-            self.assertIsNotNone(extractor)
-            print("✅ DateExtractor creation works")
-            
-        except Exception as e:
-            print(f"⚠️ DateExtractor creation test skipped: {e}")
-            self.skipTest("Skipping date extractor creation test")
+    @unittest.skipIf(date_extractor is None, "date_extractor unavailable")
+    def test_date_extraction(self):
+        """Test that natural-language dates are extracted."""
+        self.assertEqual(date_extractor.extract_date_ymd("December 25th 2025"), "2025-12-25")
+        self.assertEqual(
+            date_extractor.extract_datetime("December 25th 2025 3pm"), "2025-12-25T15:00:00"
+        )
+        self.assertIsNone(date_extractor.extract_datetime("no date here"))
     
     def test_basic_date_patterns(self):
         """Test basic date pattern recognition."""
@@ -51,12 +51,10 @@ class TestDateExtractor(unittest.TestCase):
         ]
         
         for pattern in date_patterns:
-            # Basic validation that these look like date patterns
-            self.assertIsInstance(pattern, str)
-            self.assertGreater(len(pattern), 0)
-            self.assertTrue(any(word in pattern.lower() for word in ["tomorrow", "monday", "december", "today", "week", "morning", "afternoon"]))
-        
-        print("✅ Basic date patterns are valid")
+            with self.subTest(pattern=pattern):
+                # Basic validation that these look like date patterns
+                self.assertGreater(len(pattern), 0)
+                self.assertTrue(any(word in pattern.lower() for word in _DATE_WORDS))
     
     def test_time_patterns(self):
         """Test time pattern recognition."""
@@ -72,10 +70,28 @@ class TestDateExtractor(unittest.TestCase):
         ]
         
         for pattern in time_patterns:
-            self.assertIsInstance(pattern, str)
-            self.assertGreater(len(pattern), 0)
-        
-        print("✅ Time patterns are valid")
+            with self.subTest(pattern=pattern):
+                self.assertGreater(len(pattern), 0)
+
+    @unittest.skipIf(date_extractor is None, "date_extractor unavailable")
+    def test_extract_datetime_memoized(self):
+        """Test that equivalent phrasings reuse the cached parse."""
+        date_extractor._parse_cached.cache_clear()
+        first = date_extractor.extract_datetime("25 Dec 2pm")
+        second = date_extractor.extract_datetime("  25 dec   2PM ")
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+        self.assertEqual(date_extractor._parse_cached.cache_info().hits, 1)
+
+    @unittest.skipIf(date_extractor is None, "date_extractor unavailable")
+    def test_iso_fast_path(self):
+        """Test that ISO inputs round-trip without dateutil."""
+        extract_datetime = date_extractor.extract_datetime
+        extract_date_ymd = date_extractor.extract_date_ymd
+
+        self.assertEqual(extract_datetime("2025-12-25T14:30:00"), "2025-12-25T14:30:00")
+        self.assertEqual(extract_datetime("2025-12-25 14:30"), "2025-12-25T14:30:00")
+        self.assertEqual(extract_date_ymd("2025-12-25"), "2025-12-25")
 
 
 if __name__ == '__main__':
@@ -8,7 +8,25 @@ import os
 import sys
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+
+# chatbot_engine loads the whole LLM stack, so it is imported inside the
+# tests that need it rather than at collection time
+def _import_engine_module(test):
+    """Import chatbot_engine, skipping the test if it is unavailable."""
+    try:
+        from chatbot.core import chatbot_engine
+    except ImportError as e:
+        test.skipTest(f"ChatbotEngine unavailable: {e}")
+    return chatbot_engine
+
+
+_APPOINTMENT_KEYWORDS = frozenset([
+    "call me", "contact me", "book appointment", "schedule a meeting",
+    "book a call", "reach out", "appointment", "your phone number", "email me",
+    "booking a slot", "reserve a slot", "make appointment", "set up meeting"
+])
 
 
 class TestIntentDetection(unittest.TestCase):
@@ -22,39 +40,78 @@ class TestIntentDetection(unittest.TestCase):
         for category in intent_categories:
             self.assertIsInstance(category, str)
             self.assertGreater(len(category), 0)
-        
-        print("✅ Intent categories are properly defined")
     
     def test_keyword_detection_logic(self):
         """Test basic keyword detection logic."""
-        # Test appointment keywords
-        appointment_keywords = [
-            "call me", "contact me", "book appointment", "schedule", 
-            "call", "reach out", "appointment", "phone number", "email me",
-            "book", "reserve", "make appointment", "set up meeting"
-        ]
+        contact_re = _import_engine_module(self).CONTACT_KEYWORDS_RE
         
-        # Test that these keywords would trigger appointment intent
-        for keyword in appointment_keywords:
-            has_appointment_keyword = any(app_keyword in keyword.lower() for app_keyword in appointment_keywords)
-            self.assertTrue(has_appointment_keyword, f"Keyword '{keyword}' should be detected as appointment")
+        # Requests to be contacted should trigger appointment intent
+        appointment_inputs = [
+            "Can you call me tomorrow?",
+            "I'd like to book an appointment",
+            "Please Schedule a meeting for Monday",
+            "What is your phone number",
+            "book me in",
+            "I want to book",
+            "I want to schedule",
+            "schedule me for tuesday",
+            "make a booking",
+            "Can I reserve a spot?",
+        ]
+        for user_input in appointment_inputs:
+            with self.subTest(user_input=user_input):
+                self.assertTrue(contact_re.search(user_input))
         
-        print("✅ Basic keyword detection logic works")
+        # Questions about the documents should not, even when they mention
+        # books, bookings, schedules or calls
+        qa_inputs = [
+            "What does the report conclude?",
+            "Summarize chapter two",
+            "What books are cited?",
+            "What is the booking policy?",
+            "Summarize the scheduled maintenance section",
+            "Explain the callback mechanism",
+            "What book does the author cite?",
+            "What is the schedule for phase two?",
+            "What is the phone number of the clinic in the document?",
+        ]
+        for user_input in qa_inputs:
+            with self.subTest(user_input=user_input):
+                self.assertIsNone(contact_re.search(user_input))
     
+    def test_keywords_match_engine(self):
+        """Test that the engine's matcher detects every appointment keyword."""
+        chatbot_engine = _import_engine_module(self)
+        
+        for keyword in _APPOINTMENT_KEYWORDS:
+            self.assertTrue(
+                chatbot_engine.CONTACT_KEYWORDS_RE.search(keyword),
+                f"Keyword '{keyword}' should be detected as appointment",
+            )
+
+    def test_detect_intent(self):
+        """Test that the engine routes contact requests and document questions."""
+        ChatbotEngine = _import_engine_module(self).ChatbotEngine
+        chatbot = ChatbotEngine(google_api_key="test_key")
+
+        self.assertEqual(chatbot._detect_intent("Please call me tomorrow"), "appointment")
+        self.assertEqual(chatbot._detect_intent("What books are cited?"), "qa")
+        self.assertEqual(chatbot._detect_intent("Explain the callback mechanism"), "qa")
+        self.assertEqual(chatbot._detect_intent("I want to book"), "appointment")
+        self.assertEqual(
+            chatbot._detect_intent("What is the phone number of the clinic in the document?"), "qa"
+        )
+
     def test_debug_mode_setting(self):
         """Test that debug mode can be set."""
+        ChatbotEngine = _import_engine_module(self).ChatbotEngine
         try:
-            from chatbot.core.chatbot_engine import ChatbotEngine
-            
             # Test with debug=True
             chatbot_debug = ChatbotEngine(google_api_key="test_key", debug=True)
             self.assertTrue(chatbot_debug.debug)
             
-            print("✅ Debug mode setting works")
-            
         except Exception as e:
-            print(f"⚠️ Debug mode test skipped (expected if no API key): {e}")
-            self.skipTest("Skipping debug mode test due to missing API key")
+            self.skipTest(f"Debug mode test skipped (expected if no API key): {e}")
 
 
 if __name__ == '__main__':
@@ -6,9 +6,53 @@ Simple tests for API routes functionality.
 import unittest
 import os
 import sys
+from functools import lru_cache
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+
+# The api package imports the engine and its LLM stack, so api modules are
+# imported on first use rather than at collection time, then reused
+@lru_cache(maxsize=1)
+def _load_router():
+    from api.routes import router
+    return router
+
+
+def _import_router(test):
+    """Import the router, skipping the test if it is unavailable."""
+    try:
+        return _load_router()
+    except ImportError as e:
+        test.skipTest(f"Routes unavailable: {e}")
+
+
+class _StubEngine:
+    """Stands in for ChatbotEngine so route tests skip the LLM stack."""
+
+    qa_chain = None
+
+    def chat_stream(self, message, history=None):
+        yield "Hel"
+        yield "lo"
+
+    async def achat(self, message, history=None):
+        raise RuntimeError("vector store at /srv/chroma_db is corrupt")
+
+
+def _client(test, engine):
+    """TestClient for the API app with ``engine`` as the chatbot engine."""
+    try:
+        from fastapi.testclient import TestClient
+        from api import create_app
+        from api.routes import get_chatbot_engine
+    except ImportError as e:
+        test.skipTest(f"API unavailable: {e}")
+    app = create_app()
+    app.dependency_overrides[get_chatbot_engine] = lambda: engine
+    # Not entered as a context manager, so the real engine is never built
+    return TestClient(app)
 
 
 class TestRoutes(unittest.TestCase):
@@ -16,49 +60,26 @@ class TestRoutes(unittest.TestCase):
     
     def test_routes_import(self):
         """Test that routes can be imported."""
-        try:
-            from api.routes import router
-            print("✅ Routes import successful")
-            self.assertTrue(True)
-        except ImportError as e:
-            print(f"⚠️ Routes import failed: {e}")
-            self.skipTest("Skipping routes tests due to import failure")
+        self.assertIsNotNone(_import_router(self))
     
     def test_router_creation(self):
         """Test that router can be created."""
-        try:
-            from api.routes import router
-            from fastapi import APIRouter
-            
-            self.assertIsInstance(router, APIRouter)
-            print("✅ Router creation works")
-            
-        except Exception as e:
-            print(f"⚠️ Router creation test skipped: {e}")
-            self.skipTest("Skipping router creation test")
+        from fastapi import APIRouter
+        
+        self.assertIsInstance(_import_router(self), APIRouter)
     
     def test_route_endpoints(self):
         """Test that expected route endpoints exist."""
-        try:
-            from api.routes import router
-            
-            # Get all routes
-            routes = router.routes
-            
-            # Check for expected endpoints
-            endpoint_paths = [route.path for route in routes]
-            
-            # Should have basic endpoints
-            expected_endpoints = ["/", "/health", "/status"]
-            for endpoint in expected_endpoints:
-                self.assertIn(endpoint, endpoint_paths, f"Endpoint {endpoint} should exist")
-            
-            print(f"✅ Found {len(routes)} route endpoints")
-            print(f"   Endpoints: {endpoint_paths}")
-            
-        except Exception as e:
-            print(f"⚠️ Route endpoints test skipped: {e}")
-            self.skipTest("Skipping route endpoints test")
+        # Get all routes
+        routes = _import_router(self).routes
+        
+        # Check for expected endpoints
+        endpoint_paths = frozenset(route.path for route in routes)
+        
+        # Should have basic endpoints
+        expected_endpoints = ["/", "/health", "/status"]
+        for endpoint in expected_endpoints:
+            self.assertIn(endpoint, endpoint_paths, f"Endpoint {endpoint} should exist")
     
     def test_schema_import(self):
         """Test that schema can be imported."""
@@ -68,11 +89,42 @@ class TestRoutes(unittest.TestCase):
                 QuestionResponse,
                 HealthResponse
             )
-            print("✅ Schema import successful")
-            self.assertTrue(True)
         except ImportError as e:
-            print(f"⚠️ Schema import failed: {e}")
-            self.skipTest("Skipping schema tests due to import failure")
+            self.skipTest(f"Schema unavailable: {e}")
+        for model in (QuestionRequest, QuestionResponse, HealthResponse):
+            self.assertIsNotNone(model)
+    
+    def test_ask_stream(self):
+        """Test that /ask/stream returns the streamed answer as plain text."""
+        client = _client(self, _StubEngine())
+        
+        response = client.post("/api/v1/ask/stream", data={"question": "What is alpha?"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertEqual(response.text, "Hello")
+    
+    def test_ask_errors(self):
+        """Test that bad input gives 400 and engine failures a generic 500, both with CORS headers."""
+        client = _client(self, _StubEngine())
+        headers = {"Origin": "http://localhost:8501"}
+        
+        bad_inputs = [
+            {"question": "   "},
+            {"question": "Hi", "history": "{not json"},
+            {"question": "Hi", "history": '{"role": "user"}'},
+        ]
+        for data in bad_inputs:
+            with self.subTest(data=data):
+                response = client.post("/api/v1/ask", data=data, headers=headers)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("access-control-allow-origin", response.headers)
+        
+        # The engine error is logged, not echoed to the client
+        with self.assertLogs("api.routes", level="ERROR"):
+            response = client.post("/api/v1/ask", data={"question": "Hi"}, headers=headers)
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("access-control-allow-origin", response.headers)
+        self.assertEqual(response.json()["detail"], "Internal server error")
 
 
 if __name__ == '__main__':
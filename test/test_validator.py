@@ -8,50 +8,46 @@ import os
 import sys
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
+try:
+    from chatbot.form.validator import (
+        validate_name,
+        validate_email,
+        validate_phone
+    )
+except ImportError:
+    validate_name = validate_email = validate_phone = None
 
+
+@unittest.skipIf(validate_name is None, "validator unavailable")
 class TestValidator(unittest.TestCase):
     """Simple tests for validation functionality."""
     
     def test_validator_import(self):
         """Test that validator can be imported."""
-        try:
-            from chatbot.form.validator import (
-                validate_name,
-                validate_email,
-                validate_phone
-            )
-            print("✅ Validator functions import successful")
-            self.assertTrue(True)
-        except ImportError as e:
-            print(f"⚠️ Validator import failed: {e}")
-            self.skipTest("Skipping validator tests due to import failure")
+        for func in (validate_name, validate_email, validate_phone):
+            self.assertTrue(callable(func))
     
     def test_name_validation_logic(self):
         """Test basic name validation logic."""
-        # Test valid names
-        valid_names = ["John Doe", "Jane Smith", "Bob", "Mary-Jane"]
-        for name in valid_names:
-            self.assertIsInstance(name, str)
-            self.assertGreater(len(name), 0)
-            # Basic validation: should contain letters and spaces/hyphens only
-            self.assertTrue(all(c.isalpha() or c.isspace() or c == '-' for c in name))
-        
-        # Test invalid names
-        invalid_names = ["", " ", "123", "John123", "!@#$%"]
-        for name in invalid_names:
-            # These should fail basic validation
-            if name.strip() == "":
-                self.assertEqual(len(name.strip()), 0)
-            elif any(c.isdigit() for c in name):
-                self.assertTrue(any(c.isdigit() for c in name))
+        # Valid names come back with normalized spacing and capitalization
+        valid_names = {
+            "John Doe": "John Doe",
+            "  jane   smith ": "Jane Smith",
+            "Bob": "Bob",
+        }
+        for name, cleaned in valid_names.items():
+            with self.subTest(name=name):
+                self.assertEqual(validate_name(name), (True, cleaned))
         
-        print("✅ Name validation logic works")
+        # Too short to be a name
+        for name in ["", " ", "J"]:
+            with self.subTest(name=name):
+                self.assertIs(validate_name(name)[0], False)
     
     def test_email_validation_logic(self):
         """Test basic email validation logic."""
-        # Test valid emails
         valid_emails = [
             "test@example.com",
             "user.name@domain.co.uk",
@@ -59,28 +55,18 @@ class TestValidator(unittest.TestCase):
             "123@456.com"
         ]
         for email in valid_emails:
-            self.assertIsInstance(email, str)
-            self.assertIn("@", email)
-            self.assertIn(".", email)
-            # Should have text before @ and after @
-            parts = email.split("@")
-            self.assertEqual(len(parts), 2)
-            self.assertGreater(len(parts[0]), 0)
-            self.assertGreater(len(parts[1]), 0)
+            with self.subTest(email=email):
+                self.assertEqual(validate_email(email), (True, email))
+        self.assertEqual(validate_email("Test@Example.COM"), (True, "test@example.com"))
         
-        # Test invalid emails
-        invalid_emails = ["", " ", "invalid", "@example.com", "user@", "user.com"]
+        invalid_emails = ["", " ", "invalid", "@example.com", "user@", "user.com", "a@b.c"]
         for email in invalid_emails:
-            if email.strip() == "":
-                self.assertEqual(len(email.strip()), 0)
-            elif "@" not in email:
-                self.assertNotIn("@", email)
-        
-        print("✅ Email validation logic works")
+            with self.subTest(email=email):
+                self.assertIs(validate_email(email)[0], False)
     
     def test_phone_validation_logic(self):
         """Test basic phone validation logic."""
-        # Test valid phone numbers
+        # Separators are ignored and numbers are formatted the same way
         valid_phones = [
             "555-123-4567",
             "(555) 123-4567",
@@ -89,20 +75,17 @@ class TestValidator(unittest.TestCase):
             "+1-555-123-4567"
         ]
         for phone in valid_phones:
-            self.assertIsInstance(phone, str)
-            # Should contain digits
-            digits = sum(1 for c in phone if c.isdigit())
-            self.assertGreaterEqual(digits, 10)  # At least 10 digits for US phone
+            with self.subTest(phone=phone):
+                self.assertEqual(validate_phone(phone), (True, "+1 555-123-4567"))
+        self.assertEqual(validate_phone("+44 20 7946 0958"), (True, "+44 207-946-0958"))
+        # Digits outside Latin-1 count too
+        self.assertEqual(validate_phone("٥٥٥١٢٣٤٥٦٧"), (True, "+1 ٥٥٥-١٢٣-٤٥٦٧"))
         
-        # Test invalid phone numbers
+        # Fewer than 10 digits
         invalid_phones = ["", " ", "abc", "123", "555-123"]
         for phone in invalid_phones:
-            if phone.strip() == "":
-                self.assertEqual(len(phone.strip()), 0)
-            elif not any(c.isdigit() for c in phone):
-                self.assertFalse(any(c.isdigit() for c in phone))
-        
-        print("✅ Phone validation logic works")
+            with self.subTest(phone=phone):
+                self.assertIs(validate_phone(phone)[0], False)
 
 
 if __name__ == '__main__':